@@ -0,0 +1,18 @@
+"""Identifier normalisation shared by the models and the repositories."""
+
+from __future__ import annotations
+
+import re
+from typing import Optional
+
+_NON_IDENTIFIER_CHARS = re.compile(r"[^0-9a-z]+")
+# Byte-level deletion table for the ASCII fast path: every byte except 0-9 and a-z.
+_NON_IDENTIFIER_BYTES = bytes(set(range(256)) - set(b"0123456789abcdefghijklmnopqrstuvwxyz"))
+
+
+def _normalise_identifier(value: Optional[str]) -> str:
+    if value is None:
+        return ""
+    if value.isascii():
+        return value.lower().encode("ascii").translate(None, _NON_IDENTIFIER_BYTES).decode("ascii")
+    return _NON_IDENTIFIER_CHARS.sub("", value.strip().lower())
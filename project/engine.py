@@ -2,14 +2,28 @@
 
 from __future__ import annotations
 
-from typing import Dict, Iterable, List, Optional, Tuple
+from functools import lru_cache
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
 
 import pandas as pd
 
 from .handlers_base import Handler  # noqa: F401  # for UML reference
 from .models import Area, Category, IdentifiableEntity, Journal
 from .query_handlers import CategoryQueryHandler, JournalQueryHandler
-from .repositories import _normalise_identifier
+from ._normalise import _normalise_identifier
+from .repositories import _normalise_series
+
+# Identifiers, quartiles and licenses repeat heavily across queries, so the
+# normalised form is memoised rather than recomputed on every comparison.
+_norm = lru_cache(maxsize=100_000)(_normalise_identifier)
+_JOURNAL_FIELDS = JournalQueryHandler.COLUMNS
+
+_Taxonomy = Tuple[Dict[str, Category], Dict[str, Area], Dict[str, dict]]
+
+
+def _normalise_all(values: Optional[Iterable[str]]) -> Set[str]:
+    """Normalise the identifiers of a request once, skipping empty values."""
+    return {_norm(value) for value in values or () if value}
 
 
 class BasicQueryEngine:
@@ -18,26 +32,34 @@ class BasicQueryEngine:
     def __init__(self):
         self.journalQuery: List[JournalQueryHandler] = []
         self.categoryQuery: List[CategoryQueryHandler] = []
+        # Bumped on every handler change; combined with the repositories'
+        # revisions it tells whether cached results are still current.
+        self._handlers_version = 0
+        self._taxonomy_cache: Optional[Tuple[tuple, Dict[str, dict]]] = None
 
     # -- handler management ----------------------------------------------------
 
     def cleanJournalHandlers(self) -> bool:
         self.journalQuery.clear()
+        self._handlers_version += 1
         return True
 
     def cleanCategoryHandlers(self) -> bool:
         self.categoryQuery.clear()
+        self._handlers_version += 1
         return True
 
     def addJournalHandler(self, handler: JournalQueryHandler) -> bool:
         if handler and handler not in self.journalQuery:
             self.journalQuery.append(handler)
+            self._handlers_version += 1
             return True
         return False
 
     def addCategoryHandler(self, handler: CategoryQueryHandler) -> bool:
         if handler and handler not in self.categoryQuery:
             self.categoryQuery.append(handler)
+            self._handlers_version += 1
             return True
         return False
 
@@ -45,59 +67,148 @@ class BasicQueryEngine:
 
     def _collect_journal_frames(self, method_name: str, *args, **kwargs) -> pd.DataFrame:
         frames = []
+        seen_ids = set()
         for handler in self.journalQuery:
             method = getattr(handler, method_name, None)
-            if callable(method):
-                frame = method(*args, **kwargs)
-                if isinstance(frame, pd.DataFrame) and not frame.empty:
-                    frames.append(frame)
+            if not callable(method):
+                continue
+            frame = method(*args, **kwargs)
+            if isinstance(frame, pd.DataFrame) and not frame.empty:
+                if "id" in frame.columns:
+                    # Drop rows already provided by an earlier handler before
+                    # concatenating, so duplicates are never copied.
+                    ids = frame["id"]
+                    unseen = ~(ids.isin(seen_ids) | ids.duplicated())
+                    if not unseen.all():
+                        frame = frame.loc[unseen]
+                        if frame.empty:
+                            continue
+                    seen_ids.update(frame["id"])
+                frames.append(frame)
         if not frames:
             return pd.DataFrame(columns=JournalQueryHandler.COLUMNS)
-        combined = pd.concat(frames, ignore_index=True)
-        if "id" in combined.columns:
-            combined = combined.drop_duplicates(subset="id", keep="first")
-        return combined.reset_index(drop=True)
+        if len(frames) == 1:
+            return frames[0].reset_index(drop=True)
+        return pd.concat(frames, ignore_index=True)
 
     def _collect_category_exports(self) -> Dict[str, dict]:
-        combined = {
-            "categories": {},
-            "areas": {},
-            "journal_categories": {},
-            "journal_areas": {},
-            "journal_alias": {},
-        }
-
-        for handler in self.categoryQuery:
-            repository = handler.repository
-            if not repository:
-                continue
-            export = repository.export_all()
-
-            for cid, data in export.get("categories", {}).items():
-                record = combined["categories"].setdefault(cid, {"quartiles": set(), "areas": set()})
-                record["quartiles"].update(data.get("quartiles", set()))
-                record["areas"].update(data.get("areas", set()))
-
-            for aid, data in export.get("areas", {}).items():
-                record = combined["areas"].setdefault(aid, {"categories": set()})
-                record["categories"].update(data.get("categories", set()))
+        exports = [
+            handler.repository.export_all() for handler in self.categoryQuery if handler.repository
+        ]
+
+        def combine(name: str, columns: List[str]) -> pd.DataFrame:
+            frames = [export[name] for export in exports if not export[name].empty]
+            if not frames:
+                return pd.DataFrame(columns=columns)
+            return pd.concat(frames, ignore_index=True)
+
+        # Merge all handlers at once: duplicates are dropped by pandas' hashing
+        # and every combined collection is then filled in a single pass.
+        category_quartiles = combine("category_quartiles", ["category_id", "quartile"]).drop_duplicates()
+        category_areas = combine("category_areas", ["category_id", "area_id"]).drop_duplicates()
+        journal_categories = combine(
+            "journal_categories", ["journal_id", "category_id", "quartile"]
+        ).drop_duplicates()
+        journal_areas = combine("journal_areas", ["journal_id", "area_id"]).drop_duplicates()
+        # Earlier handlers win on conflicting aliases.
+        journal_alias = combine("journal_alias", ["alias", "journal_id"]).drop_duplicates(
+            subset="alias", keep="first"
+        )
 
-            for jid, data in export.get("journal_categories", {}).items():
-                journal_record = combined["journal_categories"].setdefault(jid, {})
-                for cid, quartiles in data.items():
-                    journal_record.setdefault(cid, set()).update(quartiles)
+        # Categories keep the order in which each handler first mentions them.
+        categories: Dict[str, dict] = {}
+        for export in exports:
+            for frame in (export["category_quartiles"], export["category_areas"]):
+                for cid in frame["category_id"].tolist():
+                    if cid not in categories:
+                        categories[cid] = {"quartiles": set(), "areas": set()}
+
+        for cid, quartile in zip(
+            category_quartiles["category_id"].tolist(), category_quartiles["quartile"].tolist()
+        ):
+            categories[cid]["quartiles"].add(quartile)
+
+        areas: Dict[str, dict] = {}
+        for cid, aid in zip(category_areas["category_id"].tolist(), category_areas["area_id"].tolist()):
+            categories[cid]["areas"].add(aid)
+            areas.setdefault(aid, {"categories": set()})["categories"].add(cid)
+
+        combined_journal_categories: Dict[str, Dict[str, set]] = {}
+        for jid, cid, quartile in journal_categories.itertuples(index=False, name=None):
+            quartiles = combined_journal_categories.setdefault(jid, {}).setdefault(cid, set())
+            if isinstance(quartile, str) and quartile:
+                quartiles.add(quartile)
+
+        combined_journal_areas: Dict[str, set] = {}
+        for jid, aid in zip(journal_areas["journal_id"].tolist(), journal_areas["area_id"].tolist()):
+            combined_journal_areas.setdefault(jid, set()).add(aid)
+
+        return {
+            "categories": categories,
+            "areas": areas,
+            "journal_categories": combined_journal_categories,
+            "journal_areas": combined_journal_areas,
+            "journal_alias": dict(zip(journal_alias["alias"], journal_alias["journal_id"])),
+        }
 
-            for jid, areas in export.get("journal_areas", {}).items():
-                record = combined["journal_areas"].setdefault(jid, set())
-                record.update(areas)
+    @staticmethod
+    def _revision_key(version: int, handlers: Iterable) -> tuple:
+        # The handlers themselves are part of the key, so editing journalQuery or
+        # categoryQuery directly also invalidates the caches.
+        return (version,) + tuple(
+            (handler, handler.repository.revision() if handler.repository else None) for handler in handlers
+        )
 
-            for alias_norm, canonical in export.get("journal_alias", {}).items():
-                combined["journal_alias"].setdefault(alias_norm, canonical)
+    def _taxonomy_exports(self) -> Dict[str, dict]:
+        """Return the merged category exports, plus id-level lookup tables, cached per revision.
 
-        return combined
+        Only plain ids are cached here; the Category/Area objects handed to callers
+        are built fresh by ``_build_taxonomy`` so mutating them cannot leak into
+        later queries.
+        """
+        key = self._revision_key(self._handlers_version, self.categoryQuery)
+        if self._taxonomy_cache is not None and self._taxonomy_cache[0] == key:
+            return self._taxonomy_cache[1]
 
-    def _build_taxonomy(self) -> Tuple[Dict[str, Category], Dict[str, Area], Dict[str, dict]]:
         exports = self._collect_category_exports()
+        category_ids = set(exports["categories"])
+        for data in exports["areas"].values():
+            category_ids.update(data.get("categories", ()))
+        area_ids = set(exports["areas"])
+
+        # Resolve every alias to its category/area ids once, so building journals
+        # only needs a single lookup per identifier.
+        resolved: Dict[str, Tuple[Tuple[str, ...], Tuple[str, ...]]] = {}
+        journal_categories = exports["journal_categories"]
+        journal_areas = exports["journal_areas"]
+        alias_categories: Dict[str, Tuple[str, ...]] = {}
+        alias_areas: Dict[str, Tuple[str, ...]] = {}
+        for alias_norm, canonical in exports["journal_alias"].items():
+            entry = resolved.get(canonical)
+            if entry is None:
+                entry = (
+                    tuple(cid for cid in journal_categories.get(canonical, {}) if cid in category_ids),
+                    tuple(aid for aid in journal_areas.get(canonical, set()) if aid in area_ids),
+                )
+                resolved[canonical] = entry
+            alias_categories[alias_norm], alias_areas[alias_norm] = entry
+        exports["alias_categories"] = alias_categories
+        exports["alias_areas"] = alias_areas
+
+        category_index: Dict[str, str] = {}
+        for cid in exports["categories"]:
+            category_index.setdefault(_norm(cid), cid)
+        area_index: Dict[str, str] = {}
+        for aid in exports["areas"]:
+            area_index.setdefault(_norm(aid), aid)
+        exports["category_index"] = category_index
+        exports["area_index"] = area_index
+
+        self._taxonomy_cache = (key, exports)
+        return exports
+
+    def _build_taxonomy(self) -> _Taxonomy:
+        exports = self._taxonomy_exports()
 
         category_map: Dict[str, Category] = {}
         for cid, data in exports["categories"].items():
@@ -114,87 +225,98 @@ class BasicQueryEngine:
 
         return category_map, area_map, exports
 
-    def _build_journal_objects(self, frame: pd.DataFrame) -> List[Journal]:
-        if frame is None or frame.empty:
-            return []
+    def _build_journal_objects(
+        self,
+        frame: pd.DataFrame,
+        taxonomy: Optional[_Taxonomy] = None,
+    ) -> List[Journal]:
+        return list(self._iter_journal_objects(frame, taxonomy))
 
-        category_map, area_map, exports = self._build_taxonomy()
-        alias_map = exports.get("journal_alias", {})
-        journal_categories = exports.get("journal_categories", {})
-        journal_areas = exports.get("journal_areas", {})
+    def _iter_journal_objects(
+        self,
+        frame: pd.DataFrame,
+        taxonomy: Optional[_Taxonomy] = None,
+    ) -> Iterator[Journal]:
+        """Yield a Journal per row, linked to its categories and areas.
 
-        journals: List[Journal] = []
-        for _, row in frame.iterrows():
-            record = row.to_dict()
+        Callers that already hold the taxonomy can pass it to skip rebuilding it.
+        """
+        if frame is None or frame.empty:
+            return
+
+        category_map, area_map, exports = taxonomy or self._build_taxonomy()
+        alias_categories_get = exports["alias_categories"].get
+        alias_areas_get = exports["alias_areas"].get
+
+        # Pull each column out once as a plain list and walk them in lockstep.
+        columns = [
+            frame[column].tolist() if column in frame.columns else [None] * len(frame)
+            for column in _JOURNAL_FIELDS
+        ]
+        for (
+            identifier,
+            title,
+            print_issn,
+            electronic_issn,
+            languages,
+            publisher,
+            doaj_seal,
+            license_,
+            apc,
+            identifiers,
+        ) in zip(*columns):
             journal = Journal(
-                identifier=record.get("id"),
-                title=record.get("title"),
-                print_issn=record.get("print_issn"),
-                electronic_issn=record.get("electronic_issn"),
-                publisher=record.get("publisher"),
-                languages=list(record.get("languages") or []),
-                license_=record.get("license"),
-                has_apc=bool(record.get("apc")),
-                has_doaj_seal=bool(record.get("doaj_seal")),
+                identifier=identifier,
+                title=title,
+                print_issn=print_issn,
+                electronic_issn=electronic_issn,
+                publisher=publisher,
+                languages=languages,
+                license_=license_,
+                has_apc=bool(apc),
+                has_doaj_seal=bool(doaj_seal),
             )
 
-            identifiers = [identifier for identifier in (record.get("identifiers") or []) if identifier]
-
-            for identifier in identifiers:
-                canonical = alias_map.get(_normalise_identifier(identifier))
-                if not canonical:
-                    canonical = alias_map.get(_normalise_identifier(identifier.replace("-", "")))
-                if not canonical:
+            for alias in identifiers or ():
+                if not alias:
                     continue
+                norm = _norm(alias)
+                journal.addCategories([category_map[cid] for cid in alias_categories_get(norm, ())])
+                journal.addAreas([area_map[aid] for aid in alias_areas_get(norm, ())])
 
-                for category_id in journal_categories.get(canonical, {}).keys():
-                    category = category_map.get(category_id)
-                    if category:
-                        journal.addCategory(category)
-                for area_id in journal_areas.get(canonical, set()):
-                    area = area_map.get(area_id)
-                    if area:
-                        journal.addArea(area)
-
-            journals.append(journal)
-
-        return journals
+            yield journal
 
     def _find_category_by_identifier(
         self,
-        category_map: Dict[str, Category],
+        taxonomy: _Taxonomy,
         identifier: str,
     ) -> Optional[Category]:
-        norm = _normalise_identifier(identifier)
-        for category in category_map.values():
-            if _normalise_identifier(category.getId()) == norm:
-                return category
-        return None
+        category_map, _, exports = taxonomy
+        cid = exports["category_index"].get(_norm(identifier))
+        return category_map.get(cid) if cid is not None else None
 
     def _find_area_by_identifier(
         self,
-        area_map: Dict[str, Area],
+        taxonomy: _Taxonomy,
         identifier: str,
     ) -> Optional[Area]:
-        norm = _normalise_identifier(identifier)
-        for area in area_map.values():
-            if _normalise_identifier(area.getId()) == norm:
-                return area
-        return None
+        _, area_map, exports = taxonomy
+        aid = exports["area_index"].get(_norm(identifier))
+        return area_map.get(aid) if aid is not None else None
 
     # -- public API ------------------------------------------------------------
 
     def getEntityById(self, identifier: str) -> Optional[IdentifiableEntity]:
+        taxonomy = self._build_taxonomy()
         frame = self._collect_journal_frames("getById", identifier)
-        journals = self._build_journal_objects(frame)
-        if journals:
-            return journals[0]
+        journal = next(self._iter_journal_objects(frame, taxonomy), None)
+        if journal:
+            return journal
 
-        category_map, area_map, _ = self._build_taxonomy()
-        category = self._find_category_by_identifier(category_map, identifier)
+        category = self._find_category_by_identifier(taxonomy, identifier)
         if category:
             return category
-        area = self._find_area_by_identifier(area_map, identifier)
+        area = self._find_area_by_identifier(taxonomy, identifier)
         if area:
             return area
         return None
@@ -232,91 +354,151 @@ class BasicQueryEngine:
         return list(area_map.values())
 
     def getCategoriesWithQuartile(self, quartiles: Iterable[str]) -> List[Category]:
-        target = {_normalise_identifier(q) for q in quartiles or [] if q}
-        result = []
-        for category in self.getAllCategories():
-            quartile_norm = {_normalise_identifier(q) for q in category.getQuartiles()}
-            if not target or quartile_norm.intersection(target):
-                result.append(category)
-        return result
+        target = _normalise_all(quartiles)
+        category_map, _, _ = self._build_taxonomy()
+        return [
+            category for category in category_map.values() if not target or category._quartiles_norm & target
+        ]
 
     def getCategoriesAssignedToAreas(self, areas: Iterable[str]) -> List[Category]:
-        target = {_normalise_identifier(a) for a in areas or [] if a}
-        result = []
-        for category in self.getAllCategories():
-            area_norm = {_normalise_identifier(area.getId()) for area in category.getAreas()}
-            if not target or area_norm.intersection(target):
-                result.append(category)
-        return result
+        target = _normalise_all(areas)
+        category_map, _, _ = self._build_taxonomy()
+        return [
+            category for category in category_map.values() if not target or category._areas_norm & target
+        ]
 
     def getAreasAssignedToCategories(self, categories: Iterable[str]) -> List[Area]:
-        target = {_normalise_identifier(c) for c in categories or [] if c}
-        result = []
-        for area in self.getAllAreas():
-            category_norm = {_normalise_identifier(category.getId()) for category in area.getCategories()}
-            if not target or category_norm.intersection(target):
-                result.append(area)
-        return result
+        target = _normalise_all(categories)
+        _, area_map, _ = self._build_taxonomy()
+        return [
+            area for area in area_map.values() if not target or area._categories_norm & target
+        ]
 
 
 class FullQueryEngine(BasicQueryEngine):
     """Extend the basic engine with mashup queries."""
 
+    def __init__(self):
+        super().__init__()
+        self._journal_frame_cache: Optional[Tuple[tuple, pd.DataFrame]] = None
+
     def _journal_dataframe(self) -> pd.DataFrame:
-        return self._collect_journal_frames("getAllJournals")
+        key = self._revision_key(self._handlers_version, self.journalQuery)
+        if self._journal_frame_cache is None or self._journal_frame_cache[0] != key:
+            self._journal_frame_cache = (key, self._collect_journal_frames("getAllJournals"))
+        return self._journal_frame_cache[1]
 
     def _select_journals_by_license(
         self,
         df: pd.DataFrame,
         licenses: Iterable[str],
     ) -> pd.DataFrame:
-        license_norm = {_normalise_identifier(l) for l in licenses or [] if l}
+        license_norm = _normalise_all(licenses)
         if df.empty or not license_norm:
             return df
-        mask = df["license"].apply(
-            lambda value: _normalise_identifier(value) in license_norm if isinstance(value, str) else False
-        )
+        mask = _normalise_series(df["license"]).isin(license_norm)
         return df.loc[mask].reset_index(drop=True)
 
+    def _journal_links(self, taxonomy: _Taxonomy) -> Tuple[pd.DataFrame, pd.DataFrame]:
+        """Return tidy (journal_id, category_id) and (journal_id, area_id) frames.
+
+        Only links to categories/areas present in the taxonomy are kept, matching
+        what ``_build_journal_objects`` attaches. The frames are stored on the
+        (cached) exports so they are rebuilt together with the taxonomy.
+        """
+        category_map, area_map, exports = taxonomy
+        links = exports.get("journal_links")
+        if links is None:
+            category_links = pd.DataFrame(
+                [
+                    (jid, cid)
+                    for jid, data in exports["journal_categories"].items()
+                    for cid in data
+                    if cid in category_map
+                ],
+                columns=["journal_id", "category_id"],
+            )
+            area_links = pd.DataFrame(
+                [
+                    (jid, aid)
+                    for jid, area_ids in exports["journal_areas"].items()
+                    for aid in area_ids
+                    if aid in area_map
+                ],
+                columns=["journal_id", "area_id"],
+            )
+            links = exports["journal_links"] = (category_links, area_links)
+        return links
+
+    def _select_journals_linked_to(
+        self,
+        df: pd.DataFrame,
+        taxonomy: _Taxonomy,
+        journal_ids: Iterable[str],
+    ) -> pd.DataFrame:
+        """Keep the rows whose identifiers resolve to one of ``journal_ids``."""
+        if df.empty or "identifiers" not in df.columns:
+            return df.iloc[0:0]
+        identifiers = df["identifiers"].explode().dropna()
+        canonical = _normalise_series(identifiers).map(taxonomy[2]["journal_alias"])
+        rows = canonical.index[canonical.isin(journal_ids)]
+        return df.loc[df.index.isin(rows)].reset_index(drop=True)
+
+    def _select_journals_in_categories(
+        self,
+        df: pd.DataFrame,
+        taxonomy: _Taxonomy,
+        requested_categories: set,
+        requested_quartiles: set,
+    ) -> pd.DataFrame:
+        """Keep journals with at least one category matching both the id and quartile filters."""
+        category_ids = [
+            cid
+            for cid, category in taxonomy[0].items()
+            if (not requested_categories or category._id_norm in requested_categories)
+            and (not requested_quartiles or category._quartiles_norm & requested_quartiles)
+        ]
+        category_links, _ = self._journal_links(taxonomy)
+        journal_ids = category_links.loc[category_links["category_id"].isin(category_ids), "journal_id"]
+        return self._select_journals_linked_to(df, taxonomy, journal_ids)
+
+    def _select_journals_in_areas(
+        self,
+        df: pd.DataFrame,
+        taxonomy: _Taxonomy,
+        requested_areas: set,
+    ) -> pd.DataFrame:
+        area_ids = [aid for aid, area in taxonomy[1].items() if area._id_norm in requested_areas]
+        _, area_links = self._journal_links(taxonomy)
+        journal_ids = area_links.loc[area_links["area_id"].isin(area_ids), "journal_id"]
+        return self._select_journals_linked_to(df, taxonomy, journal_ids)
+
     def getJournalsInCategoriesWithQuartile(
         self,
         categories: Iterable[str],
         quartiles: Iterable[str],
     ) -> List[Journal]:
-        requested_categories = {_normalise_identifier(c) for c in categories or [] if c}
-        requested_quartiles = {_normalise_identifier(q) for q in quartiles or [] if q}
+        requested_categories = _normalise_all(categories)
+        requested_quartiles = _normalise_all(quartiles)
 
-        df = self._journal_dataframe()
-        journals = self._build_journal_objects(df)
-
-        result = []
-        for journal in journals:
-            for category in journal.getCategories():
-                category_id_norm = _normalise_identifier(category.getId())
-                quartile_norm = {_normalise_identifier(q) for q in category.getQuartiles()}
-                cat_match = not requested_categories or category_id_norm in requested_categories
-                quartile_match = not requested_quartiles or quartile_norm.intersection(requested_quartiles)
-                if cat_match and quartile_match:
-                    result.append(journal)
-                    break
-        return result
+        taxonomy = self._build_taxonomy()
+        df = self._select_journals_in_categories(
+            self._journal_dataframe(), taxonomy, requested_categories, requested_quartiles
+        )
+        return self._build_journal_objects(df, taxonomy)
 
     def getJournalsInAreasWithLicense(
         self,
         areas: Iterable[str],
         licenses: Iterable[str],
     ) -> List[Journal]:
-        requested_areas = {_normalise_identifier(a) for a in areas or [] if a}
+        requested_areas = _normalise_all(areas)
 
+        taxonomy = self._build_taxonomy()
         df = self._select_journals_by_license(self._journal_dataframe(), licenses)
-        journals = self._build_journal_objects(df)
-
-        result = []
-        for journal in journals:
-            area_norm = {_normalise_identifier(area.getId()) for area in journal.getAreas()}
-            if not requested_areas or area_norm.intersection(requested_areas):
-                result.append(journal)
-        return result
+        if requested_areas:
+            df = self._select_journals_in_areas(df, taxonomy, requested_areas)
+        return self._build_journal_objects(df, taxonomy)
 
     def getDiamondJournalsInAreasAndCategoriesWithQuartile(
         self,
@@ -324,38 +506,15 @@ class FullQueryEngine(BasicQueryEngine):
         categories: Iterable[str],
         quartiles: Iterable[str],
     ) -> List[Journal]:
-        requested_areas = {_normalise_identifier(a) for a in areas or [] if a}
-        requested_categories = {_normalise_identifier(c) for c in categories or [] if c}
-        requested_quartiles = {_normalise_identifier(q) for q in quartiles or [] if q}
+        requested_areas = _normalise_all(areas)
+        requested_categories = _normalise_all(categories)
+        requested_quartiles = _normalise_all(quartiles)
 
+        taxonomy = self._build_taxonomy()
         df = self._journal_dataframe()
         # Filter upfront for journals without APC
-        df = df.loc[df["apc"] == False].reset_index(drop=True)  # noqa: E712
-        journals = self._build_journal_objects(df)
-
-        result = []
-        for journal in journals:
-            area_norm = {_normalise_identifier(area.getId()) for area in journal.getAreas()}
-            if requested_areas and not area_norm.intersection(requested_areas):
-                continue
-
-            categories_norm = [
-                (
-                    _normalise_identifier(category.getId()),
-                    {_normalise_identifier(q) for q in category.getQuartiles()},
-                )
-                for category in journal.getCategories()
-            ]
-
-            category_match = False
-            for category_id, quartile_set in categories_norm:
-                cat_ok = not requested_categories or category_id in requested_categories
-                quart_ok = not requested_quartiles or quartile_set.intersection(requested_quartiles)
-                if cat_ok and quart_ok:
-                    category_match = True
-                    break
-
-            if category_match:
-                result.append(journal)
-
-        return result
+        df = df.loc[~df["apc"].fillna(False).astype(bool)].reset_index(drop=True)
+        if requested_areas:
+            df = self._select_journals_in_areas(df, taxonomy, requested_areas)
+        df = self._select_journals_in_categories(df, taxonomy, requested_categories, requested_quartiles)
+        return self._build_journal_objects(df, taxonomy)
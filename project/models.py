@@ -2,15 +2,19 @@
 
 from __future__ import annotations
 
-from collections import OrderedDict
-from typing import List, Optional, Sequence, Set
+from typing import Dict, FrozenSet, Iterable, List, Optional, Sequence, Set
+
+from ._normalise import _normalise_identifier
 
 
 class IdentifiableEntity:
     """Base class for entities that expose an identifier and a human-friendly name."""
 
+    __slots__ = ("_id", "_id_norm", "_name")
+
     def __init__(self, entity_id: Optional[str] = None, name: Optional[str] = None):
         self._id = (entity_id or "").strip()
+        self._id_norm = _normalise_identifier(self._id)
         self._name = (name or "").strip()
 
     def getId(self) -> str:
@@ -21,6 +25,7 @@ class IdentifiableEntity:
 
     def setId(self, entity_id: Optional[str]) -> None:
         self._id = (entity_id or "").strip()
+        self._id_norm = _normalise_identifier(self._id)
 
     def getName(self) -> str:
         return self._name
@@ -35,13 +40,17 @@ class IdentifiableEntity:
 class Area(IdentifiableEntity):
     """Represents a Scimago area."""
 
+    __slots__ = ("_categories", "_categories_norm")
+
     def __init__(self, area_id: Optional[str] = None):
         super().__init__(area_id, area_id)
-        self._categories: "OrderedDict[str, Category]" = OrderedDict()
+        self._categories: Dict[str, Category] = {}
+        self._categories_norm: FrozenSet[str] = frozenset()
 
     def _link_category(self, category: "Category") -> None:
         if category and category.getId():
             self._categories.setdefault(category.getId(), category)
+            self._categories_norm |= {category._id_norm}
 
     def addCategory(self, category: "Category") -> None:
         if category and category.getId():
@@ -58,16 +67,22 @@ class Area(IdentifiableEntity):
 class Category(IdentifiableEntity):
     """Represents a Scimago category associated with quartiles and areas."""
 
+    __slots__ = ("_quartiles", "_areas", "_quartiles_norm", "_areas_norm")
+
     def __init__(self, category_id: Optional[str] = None):
         super().__init__(category_id, category_id)
-        self._quartiles: "OrderedDict[str, bool]" = OrderedDict()
-        self._areas: "OrderedDict[str, Area]" = OrderedDict()
+        self._quartiles: Dict[str, bool] = {}
+        self._areas: Dict[str, Area] = {}
+        # Normalised views kept in sync by the mutators for cheap filtering.
+        self._quartiles_norm: FrozenSet[str] = frozenset()
+        self._areas_norm: FrozenSet[str] = frozenset()
 
     def addQuartile(self, quartile: Optional[str]) -> None:
         if quartile:
             quartile_clean = quartile.strip()
             if quartile_clean:
                 self._quartiles.setdefault(quartile_clean, True)
+                self._quartiles_norm |= {_normalise_identifier(quartile_clean)}
 
     def getQuartiles(self) -> List[str]:
         return list(self._quartiles.keys())
@@ -78,6 +93,7 @@ class Category(IdentifiableEntity):
     def _link_area(self, area: Area) -> None:
         if area and area.getId():
             self._areas.setdefault(area.getId(), area)
+            self._areas_norm |= {area._id_norm}
 
     def addArea(self, area: Area) -> None:
         if area and area.getId():
@@ -94,6 +110,19 @@ class Category(IdentifiableEntity):
 class Journal(IdentifiableEntity):
     """Represents a DOAJ journal."""
 
+    __slots__ = (
+        "_title",
+        "_print_issn",
+        "_electronic_issn",
+        "_publisher",
+        "_languages",
+        "_license",
+        "_has_apc",
+        "_has_doaj_seal",
+        "_categories",
+        "_areas",
+    )
+
     def __init__(
         self,
         identifier: Optional[str] = None,
@@ -111,12 +140,12 @@ class Journal(IdentifiableEntity):
         self._print_issn = (print_issn or "").strip()
         self._electronic_issn = (electronic_issn or "").strip()
         self._publisher = (publisher or "").strip()
-        self._languages = [lang.strip() for lang in (languages or []) if lang and lang.strip()]
+        self._languages = tuple(lang.strip() for lang in (languages or ()) if lang and lang.strip())
         self._license = (license_ or "").strip()
         self._has_apc = bool(has_apc)
         self._has_doaj_seal = bool(has_doaj_seal)
-        self._categories: "OrderedDict[str, Category]" = OrderedDict()
-        self._areas: "OrderedDict[str, Area]" = OrderedDict()
+        self._categories: Dict[str, Category] = {}
+        self._areas: Dict[str, Area] = {}
 
     def getTitle(self) -> str:
         return self._title
@@ -164,6 +193,12 @@ class Journal(IdentifiableEntity):
         if category and category.getId():
             self._categories.setdefault(category.getId(), category)
 
+    def addCategories(self, categories: Iterable[Category]) -> None:
+        setdefault = self._categories.setdefault
+        for category in categories:
+            if category and category.getId():
+                setdefault(category.getId(), category)
+
     def getCategories(self) -> List[Category]:
         return list(self._categories.values())
 
@@ -174,6 +209,12 @@ class Journal(IdentifiableEntity):
         if area and area.getId():
             self._areas.setdefault(area.getId(), area)
 
+    def addAreas(self, areas: Iterable[Area]) -> None:
+        setdefault = self._areas.setdefault
+        for area in areas:
+            if area and area.getId():
+                setdefault(area.getId(), area)
+
     def getAreas(self) -> List[Area]:
         return list(self._areas.values())
 
@@ -181,12 +222,6 @@ class Journal(IdentifiableEntity):
         return bool(self._areas)
 
     def getAllIdentifiers(self) -> Set[str]:
-        identifiers = {self.getId()}
-        if self._print_issn:
-            identifiers.add(self._print_issn)
-        if self._electronic_issn:
-            identifiers.add(self._electronic_issn)
-        if self._title:
-            identifiers.add(self._title)
-        return {identifier for identifier in identifiers if identifier}
+        candidates = (self._id, self._print_issn, self._electronic_issn, self._title)
+        return {identifier for identifier in candidates if identifier}
 
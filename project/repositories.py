@@ -4,26 +4,47 @@ from __future__ import annotations
 
 import json
 import os
-import re
 import socket
 import sqlite3
 import uuid
 from collections import defaultdict
-from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, FrozenSet, Iterable, List, Optional, Sequence, Set, Tuple
 
 import pandas as pd
 import requests
+from requests.adapters import HTTPAdapter
 from urllib.parse import urlparse
 
+from ._normalise import _NON_IDENTIFIER_CHARS, _normalise_identifier
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    _json_loads = json.loads
+else:
+    _json_loads = orjson.loads
+
+try:
+    import pyarrow  # noqa: F401
+except ImportError:  # pragma: no cover - optional dependency
+    _CSV_ENGINE = "c"
+else:
+    # Multi-threaded parser that fills the Arrow-backed string columns directly.
+    _CSV_ENGINE = "pyarrow"
+
+# pandas 3 always copies on write; pandas 2 only when the option is switched on.
+# Without it a shallow copy would let callers modify shared cached data.
+_COPY_ON_WRITE = int(pd.__version__.split(".")[0]) >= 3 or pd.options.mode.copy_on_write is True
+
 
 # ---------------------------------------------------------------------------
 # Shared helpers
 # ---------------------------------------------------------------------------
 
-def _normalise_identifier(value: Optional[str]) -> str:
-    if value is None:
-        return ""
-    return re.sub(r"[^0-9a-z]+", "", value.strip().lower())
+def _normalise_series(values: pd.Series) -> pd.Series:
+    """Vectorised counterpart of ``_normalise_identifier``; missing values stay NA."""
+    return values.astype("string").str.strip().str.lower().str.replace(_NON_IDENTIFIER_CHARS, "", regex=True)
 
 
 def _ensure_dir(path: str) -> None:
@@ -41,9 +62,28 @@ class SQLiteCategoryRepository:
 
     def __init__(self, path: str):
         self.path = path
+        self._conn: Optional[sqlite3.Connection] = None
+        # Listing frames memoised per database revision: name -> (revision, frame).
+        self._listing_cache: Dict[str, Tuple[Tuple[object, ...], pd.DataFrame]] = {}
 
     # -- schema ----------------------------------------------------------------
 
+    # Indexes beyond the primary keys, by name. journal_id/category_id lookups are
+    # covered by the leading primary key columns; only the area side of
+    # category_area needs its own index. The expression indexes match the
+    # identifier lookups in fetch_entity_by_identifier.
+    _SECONDARY_INDEXES: Dict[str, str] = {
+        "idx_category_area_area": "CREATE INDEX IF NOT EXISTS idx_category_area_area ON category_area(area_id)",
+        "idx_category_norm": "CREATE INDEX IF NOT EXISTS idx_category_norm ON category(LOWER(REPLACE(id, '-', '')))",
+        "idx_area_norm": "CREATE INDEX IF NOT EXISTS idx_area_norm ON area(LOWER(REPLACE(id, '-', '')))",
+        "idx_journal_alias_norm": (
+            "CREATE INDEX IF NOT EXISTS idx_journal_alias_norm ON journal_alias(LOWER(REPLACE(alias, '-', '')))"
+        ),
+    }
+
+    # Listing columns cached as tuples and handed out as fresh lists.
+    _LIST_COLUMNS: FrozenSet[str] = frozenset({"quartiles", "areas", "categories"})
+
     @staticmethod
     def _initialise_schema(conn: sqlite3.Connection) -> None:
         conn.executescript(
@@ -99,14 +139,37 @@ class SQLiteCategoryRepository:
             );
             """
         )
-
-    def _connect(self) -> sqlite3.Connection:
-        _ensure_dir(self.path)
-        conn = sqlite3.connect(self.path)
-        conn.row_factory = sqlite3.Row
-        conn.execute("PRAGMA foreign_keys = ON;")
-        self._initialise_schema(conn)
-        return conn
+        for statement in SQLiteCategoryRepository._SECONDARY_INDEXES.values():
+            conn.execute(statement)
+
+    def _get_conn(self) -> sqlite3.Connection:
+        """Return the repository's connection, opening and configuring it on first use."""
+        if self._conn is None:
+            _ensure_dir(self.path)
+            conn = sqlite3.connect(self.path, check_same_thread=False)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA foreign_keys = ON;")
+            conn.execute("PRAGMA journal_mode = WAL;")
+            conn.execute("PRAGMA synchronous = NORMAL;")
+            conn.execute("PRAGMA temp_store = MEMORY;")
+            conn.execute("PRAGMA cache_size = -65536;")
+            conn.execute("PRAGMA mmap_size = 268435456;")
+            self._initialise_schema(conn)
+            self._conn = conn
+        return self._conn
+
+    def revision(self) -> Tuple[object, ...]:
+        """Return a token that changes whenever the database file is written."""
+        token: List[object] = [self.path]
+        # In WAL mode commits land in the -wal file until a checkpoint.
+        for path in (self.path, self.path + "-wal"):
+            try:
+                stat = os.stat(path)
+            except OSError:
+                token.append(None)
+            else:
+                token.extend((stat.st_mtime_ns, stat.st_size))
+        return tuple(token)
 
     # -- loading ---------------------------------------------------------------
 
@@ -114,118 +177,192 @@ class SQLiteCategoryRepository:
         if not self.path or not file_path or not os.path.isfile(file_path):
             return False
 
-        with open(file_path, "r", encoding="utf-8") as handler:
-            payload = json.load(handler)
+        with open(file_path, "rb") as handler:
+            payload = _json_loads(handler.read())
 
         if not isinstance(payload, list):
             return False
 
-        with self._connect() as conn:
-            cursor = conn.cursor()
-            for entry in payload:
-                identifiers = [str(i).strip() for i in entry.get("identifiers", []) if str(i).strip()]
-                if not identifiers:
-                    identifiers = [str(uuid.uuid4())]
-                canonical = identifiers[0]
-
-                cursor.execute(
-                    "INSERT OR IGNORE INTO journal(id) VALUES (?)",
-                    (canonical,),
-                )
-
-                aliases = set(identifiers)
-                aliases.update(alias.replace("-", "") for alias in identifiers if alias)
-
-                for alias in aliases:
-                    cursor.execute(
-                        "INSERT OR IGNORE INTO journal_alias(alias, journal_id) VALUES (?, ?)",
-                        (alias, canonical),
-                    )
-
-                categories = entry.get("categories", [])
-                areas = [str(a).strip() for a in entry.get("areas", []) if str(a).strip()]
-
-                for area_id in areas:
-                    cursor.execute("INSERT OR IGNORE INTO area(id) VALUES (?)", (area_id,))
-
-                for category_entry in categories:
-                    category_id = str(category_entry.get("id", "")).strip()
-                    quartile = str(category_entry.get("quartile", "")).strip()
-                    if not category_id:
-                        continue
-
-                    cursor.execute("INSERT OR IGNORE INTO category(id) VALUES (?)", (category_id,))
-
-                    if quartile:
-                        cursor.execute(
-                            "INSERT OR IGNORE INTO category_quartile(category_id, quartile) VALUES (?, ?)",
-                            (category_id, quartile),
-                        )
-
-                    for area_id in areas:
-                        cursor.execute(
-                            "INSERT OR IGNORE INTO category_area(category_id, area_id) VALUES (?, ?)",
-                            (category_id, area_id),
-                        )
-
-                    cursor.execute(
-                        "INSERT OR IGNORE INTO journal_category(journal_id, category_id, quartile) VALUES (?, ?, ?)",
-                        (canonical, category_id, quartile if quartile else None),
-                    )
-
-                for area_id in areas:
-                    cursor.execute(
-                        "INSERT OR IGNORE INTO journal_area(journal_id, area_id) VALUES (?, ?)",
-                        (canonical, area_id),
-                    )
-
-            conn.commit()
+        # Collect the rows per table first (insertion-ordered, without duplicates)
+        # so each table is written with a single executemany call.
+        journals: Dict[str, None] = {}
+        aliases: Dict[str, str] = {}
+        areas: Dict[str, None] = {}
+        categories: Dict[str, None] = {}
+        category_quartiles: Dict[Tuple[str, str], None] = {}
+        category_areas: Dict[Tuple[str, str], None] = {}
+        journal_categories: Dict[Tuple[str, str, Optional[str]], None] = {}
+        journal_areas: Dict[Tuple[str, str], None] = {}
+
+        for entry in payload:
+            identifiers = [str(i).strip() for i in entry.get("identifiers", []) if str(i).strip()]
+            if not identifiers:
+                identifiers = [uuid.uuid4().hex]
+            canonical = identifiers[0]
+            journals[canonical] = None
+
+            entry_aliases = set(identifiers)
+            entry_aliases.update(alias.replace("-", "") for alias in identifiers if alias)
+            for alias in entry_aliases:
+                aliases.setdefault(alias, canonical)
+
+            entry_areas = [str(a).strip() for a in entry.get("areas", []) if str(a).strip()]
+            areas.update(dict.fromkeys(entry_areas))
+
+            for category_entry in entry.get("categories", []):
+                category_id = str(category_entry.get("id", "")).strip()
+                quartile = str(category_entry.get("quartile", "")).strip()
+                if not category_id:
+                    continue
+
+                categories[category_id] = None
+                if quartile:
+                    category_quartiles[(category_id, quartile)] = None
+                for area_id in entry_areas:
+                    category_areas[(category_id, area_id)] = None
+                journal_categories[(canonical, category_id, quartile if quartile else None)] = None
+
+            for area_id in entry_areas:
+                journal_areas[(canonical, area_id)] = None
+
+        with self._get_conn() as conn:
+            # sqlite3 only opens its implicit transaction before the first INSERT, so
+            # begin explicitly: a failed load then rolls the DROP INDEX back as well.
+            conn.execute("BEGIN")
+            # Secondary indexes are rebuilt in bulk once the rows are in, instead of
+            # being maintained row by row; the primary keys stay for INSERT OR IGNORE.
+            for name in self._SECONDARY_INDEXES:
+                conn.execute(f"DROP INDEX IF EXISTS {name}")
+            # zip() wraps the single-column rows in tuples without a Python-level loop.
+            conn.executemany("INSERT OR IGNORE INTO journal(id) VALUES (?)", zip(journals))
+            conn.executemany(
+                "INSERT OR IGNORE INTO journal_alias(alias, journal_id) VALUES (?, ?)",
+                aliases.items(),
+            )
+            conn.executemany("INSERT OR IGNORE INTO area(id) VALUES (?)", zip(areas))
+            conn.executemany("INSERT OR IGNORE INTO category(id) VALUES (?)", zip(categories))
+            conn.executemany(
+                "INSERT OR IGNORE INTO category_quartile(category_id, quartile) VALUES (?, ?)",
+                category_quartiles,
+            )
+            conn.executemany(
+                "INSERT OR IGNORE INTO category_area(category_id, area_id) VALUES (?, ?)",
+                category_areas,
+            )
+            conn.executemany(
+                "INSERT OR IGNORE INTO journal_category(journal_id, category_id, quartile) VALUES (?, ?, ?)",
+                journal_categories,
+            )
+            conn.executemany(
+                "INSERT OR IGNORE INTO journal_area(journal_id, area_id) VALUES (?, ?)",
+                journal_areas,
+            )
+            for statement in self._SECONDARY_INDEXES.values():
+                conn.execute(statement)
         return True
 
     # -- helpers ---------------------------------------------------------------
 
+    @staticmethod
+    def _grouped_lists(pairs: pd.DataFrame, key: str, value: str, ids: pd.Series) -> List[Tuple[str, ...]]:
+        """Collect the sorted, distinct ``value`` entries per ``key`` aligned to ``ids``.
+
+        Tuples keep the cached listings immutable; ``_public_columns`` turns
+        them back into fresh lists for every caller.
+        """
+        grouped = pairs.groupby(key, sort=False)[value].agg(tuple)
+        return [grouped.get(i, ()) for i in ids]
+
+    def _cached_listing(self, name: str, build: Callable[[], pd.DataFrame]) -> pd.DataFrame:
+        """Return the memoised listing ``name``, rebuilding it when the database changed."""
+        revision = self.revision()
+        cached = self._listing_cache.get(name)
+        if cached is None or cached[0] != revision:
+            cached = (revision, build())
+            self._listing_cache[name] = cached
+        return cached[1]
+
+    @classmethod
+    def _public_columns(cls, df: pd.DataFrame) -> pd.DataFrame:
+        """Return a copy of ``df`` without the private, underscore-prefixed columns.
+
+        The tuple cells of the cached listing become new lists, so callers
+        can modify the result without touching the cache.
+        """
+        public = df[[column for column in df.columns if not column.startswith("_")]].copy()
+        for column in cls._LIST_COLUMNS.intersection(public.columns):
+            public[column] = [list(cell) for cell in public[column]]
+        return public
+
     def _fetch_all_categories(self) -> pd.DataFrame:
-        with self._connect() as conn:
-            rows = conn.execute(
-                """
-                SELECT
-                    c.id AS category_id,
-                    GROUP_CONCAT(DISTINCT cq.quartile) AS quartiles,
-                    GROUP_CONCAT(DISTINCT ca.area_id) AS areas
-                FROM category c
-                LEFT JOIN category_quartile cq ON cq.category_id = c.id
-                LEFT JOIN category_area ca ON ca.category_id = c.id
-                GROUP BY c.id
-                ORDER BY c.id
-                """
-            ).fetchall()
-
-        data = []
-        for row in rows:
-            quartiles = sorted({item for item in (row["quartiles"] or "").split(",") if item})
-            areas = sorted({item for item in (row["areas"] or "").split(",") if item})
-            data.append({"id": row["category_id"], "quartiles": quartiles, "areas": areas})
-        return pd.DataFrame(data)
+        return self._public_columns(self._cached_listing("categories", self._build_all_categories))
 
     def _fetch_all_areas(self) -> pd.DataFrame:
-        with self._connect() as conn:
-            rows = conn.execute(
-                """
-                SELECT
-                    a.id AS area_id,
-                    GROUP_CONCAT(DISTINCT ca.category_id) AS categories
-                FROM area a
-                LEFT JOIN category_area ca ON ca.area_id = a.id
-                GROUP BY a.id
-                ORDER BY a.id
-                """
-            ).fetchall()
-
-        data = []
-        for row in rows:
-            categories = sorted({item for item in (row["categories"] or "").split(",") if item})
-            data.append({"id": row["area_id"], "categories": categories})
-        return pd.DataFrame(data)
+        return self._public_columns(self._cached_listing("areas", self._build_all_areas))
+
+    def _filter_listing(
+        self,
+        name: str,
+        build: Callable[[], pd.DataFrame],
+        column: str,
+        values: Iterable[str],
+    ) -> pd.DataFrame:
+        """Keep the rows whose normalised ``column`` set shares an entry with ``values``."""
+        query_norm = frozenset(_normalise_identifier(v) for v in values or [] if v)
+        df = self._cached_listing(name, build)
+        # No requested values means no filter: hand back the whole listing.
+        if not query_norm or df.empty:
+            return self._public_columns(df)
+        mask = ~df[column].map(query_norm.isdisjoint).astype(bool)
+        return self._public_columns(df.loc[mask].reset_index(drop=True))
+
+    def _build_all_categories(self) -> pd.DataFrame:
+        conn = self._get_conn()
+        categories = pd.read_sql_query("SELECT id FROM category ORDER BY id", conn)
+        quartiles = pd.read_sql_query(
+            """
+            SELECT DISTINCT c.id AS category_id, cq.quartile
+            FROM category c
+            JOIN category_quartile cq ON cq.category_id = c.id
+            WHERE cq.quartile <> ''
+            ORDER BY c.id, cq.quartile
+            """,
+            conn,
+        )
+        areas = pd.read_sql_query(
+            """
+            SELECT DISTINCT c.id AS category_id, ca.area_id
+            FROM category c
+            JOIN category_area ca ON ca.category_id = c.id
+            WHERE ca.area_id <> ''
+            ORDER BY c.id, ca.area_id
+            """,
+            conn,
+        )
+
+        categories["quartiles"] = self._grouped_lists(quartiles, "category_id", "quartile", categories["id"])
+        categories["areas"] = self._grouped_lists(areas, "category_id", "area_id", categories["id"])
+        categories["_quartiles_norm"] = [frozenset(map(_normalise_identifier, xs)) for xs in categories["quartiles"]]
+        categories["_areas_norm"] = [frozenset(map(_normalise_identifier, xs)) for xs in categories["areas"]]
+        return categories
+
+    def _build_all_areas(self) -> pd.DataFrame:
+        conn = self._get_conn()
+        areas = pd.read_sql_query("SELECT id FROM area ORDER BY id", conn)
+        categories = pd.read_sql_query(
+            """
+            SELECT DISTINCT a.id AS area_id, ca.category_id
+            FROM area a
+            JOIN category_area ca ON ca.area_id = a.id
+            WHERE ca.category_id <> ''
+            ORDER BY a.id, ca.category_id
+            """,
+            conn,
+        )
+
+        areas["categories"] = self._grouped_lists(categories, "area_id", "category_id", areas["id"])
+        areas["_categories_norm"] = [frozenset(map(_normalise_identifier, xs)) for xs in areas["categories"]]
+        return areas
 
     # -- public querying -------------------------------------------------------
 
@@ -236,59 +373,38 @@ class SQLiteCategoryRepository:
         return self._fetch_all_areas()
 
     def fetch_categories_with_quartiles(self, quartiles: Iterable[str]) -> pd.DataFrame:
-        quartile_norm = {_normalise_identifier(q) for q in quartiles or [] if q}
-        df = self._fetch_all_categories()
-        if df.empty or not quartile_norm:
-            return df
-        mask = df["quartiles"].apply(
-            lambda items: bool({_normalise_identifier(i) for i in items}.intersection(quartile_norm))
-        )
-        return df.loc[mask].reset_index(drop=True)
+        return self._filter_listing("categories", self._build_all_categories, "_quartiles_norm", quartiles)
 
     def fetch_categories_assigned_to_areas(self, areas: Iterable[str]) -> pd.DataFrame:
-        area_norm = {_normalise_identifier(a) for a in areas or [] if a}
-        df = self._fetch_all_categories()
-        if df.empty or not area_norm:
-            return df
-        mask = df["areas"].apply(
-            lambda items: bool({_normalise_identifier(i) for i in items}.intersection(area_norm))
-        )
-        return df.loc[mask].reset_index(drop=True)
+        return self._filter_listing("categories", self._build_all_categories, "_areas_norm", areas)
 
     def fetch_areas_assigned_to_categories(self, categories: Iterable[str]) -> pd.DataFrame:
-        category_norm = {_normalise_identifier(c) for c in categories or [] if c}
-        df = self._fetch_all_areas()
-        if df.empty or not category_norm:
-            return df
-        mask = df["categories"].apply(
-            lambda items: bool({_normalise_identifier(i) for i in items}.intersection(category_norm))
-        )
-        return df.loc[mask].reset_index(drop=True)
+        return self._filter_listing("areas", self._build_all_areas, "_categories_norm", categories)
 
     def resolve_journal(self, identifier: str) -> Optional[str]:
         if not identifier:
             return None
         identifier_variants = [identifier, identifier.replace("-", "")]
-        with self._connect() as conn:
-            for variant in identifier_variants:
-                row = conn.execute(
-                    "SELECT journal_id FROM journal_alias WHERE alias = ? COLLATE NOCASE LIMIT 1",
-                    (variant,),
-                ).fetchone()
-                if row:
-                    return row["journal_id"]
+        conn = self._get_conn()
+        for variant in identifier_variants:
+            row = conn.execute(
+                "SELECT journal_id FROM journal_alias WHERE alias = ? COLLATE NOCASE LIMIT 1",
+                (variant,),
+            ).fetchone()
+            if row:
+                return row["journal_id"]
         return None
 
     def fetch_journal_categories(self, journal_id: str) -> Dict[str, Set[str]]:
-        with self._connect() as conn:
-            rows = conn.execute(
-                """
-                SELECT category_id, quartile
-                FROM journal_category
-                WHERE journal_id = ?
-                """,
-                (journal_id,),
-            ).fetchall()
+        conn = self._get_conn()
+        rows = conn.execute(
+            """
+            SELECT category_id, quartile
+            FROM journal_category
+            WHERE journal_id = ?
+            """,
+            (journal_id,),
+        ).fetchall()
 
         result: Dict[str, Set[str]] = defaultdict(set)
         for row in rows:
@@ -301,11 +417,11 @@ class SQLiteCategoryRepository:
         return result
 
     def fetch_journal_areas(self, journal_id: str) -> Set[str]:
-        with self._connect() as conn:
-            rows = conn.execute(
-                "SELECT area_id FROM journal_area WHERE journal_id = ?",
-                (journal_id,),
-            ).fetchall()
+        conn = self._get_conn()
+        rows = conn.execute(
+            "SELECT area_id FROM journal_area WHERE journal_id = ?",
+            (journal_id,),
+        ).fetchall()
         return {row["area_id"] for row in rows}
 
     def fetch_entity_by_identifier(self, identifier: str) -> pd.DataFrame:
@@ -314,125 +430,94 @@ class SQLiteCategoryRepository:
                 columns=["type", "id", "quartiles", "areas", "categories"]
             )
 
-        norm = _normalise_identifier(identifier)
-        with self._connect() as conn:
-            category_row = conn.execute(
-                "SELECT id FROM category WHERE LOWER(REPLACE(id, '-', '')) = ? LIMIT 1",
-                (norm,),
-            ).fetchone()
-            if category_row:
-                all_categories = self._fetch_all_categories()
-                match = all_categories.loc[all_categories["id"] == category_row["id"]]
-                if not match.empty:
-                    row = match.iloc[0]
-                    return pd.DataFrame(
-                        [
-                            {
-                                "type": "category",
-                                "id": row["id"],
-                                "quartiles": row["quartiles"],
-                                "areas": row["areas"],
-                            }
-                        ]
-                    )
-
-            area_row = conn.execute(
-                "SELECT id FROM area WHERE LOWER(REPLACE(id, '-', '')) = ? LIMIT 1",
-                (norm,),
-            ).fetchone()
-            if area_row:
-                all_areas = self._fetch_all_areas()
-                match = all_areas.loc[all_areas["id"] == area_row["id"]]
-                if not match.empty:
-                    row = match.iloc[0]
-                    return pd.DataFrame(
-                        [
-                            {
-                                "type": "area",
-                                "id": row["id"],
-                                "categories": row["categories"],
-                            }
-                        ]
-                    )
-
-            journal_row = conn.execute(
-                "SELECT journal_id FROM journal_alias WHERE LOWER(REPLACE(alias, '-', '')) = ? LIMIT 1",
-                (norm,),
-            ).fetchone()
-            if journal_row:
-                journal_id = journal_row["journal_id"]
-                categories = self.fetch_journal_categories(journal_id)
-                areas = sorted(self.fetch_journal_areas(journal_id))
-                return pd.DataFrame(
-                    [
-                        {
-                            "type": "journal",
-                            "id": journal_id,
-                            "categories": sorted(categories.keys()),
-                            "areas": areas,
-                        }
-                    ]
-                )
+        # One round trip resolves the identifier; categories win over areas, and
+        # areas over journal aliases, as with separate lookups in that order.
+        row = self._get_conn().execute(
+            """
+            SELECT type, id
+            FROM (
+                SELECT 0 AS rank, rowid AS seq, 'category' AS type, id
+                FROM category WHERE LOWER(REPLACE(id, '-', '')) = :norm
+                UNION ALL
+                SELECT 1, rowid, 'area', id
+                FROM area WHERE LOWER(REPLACE(id, '-', '')) = :norm
+                UNION ALL
+                SELECT 2, rowid, 'journal', journal_id
+                FROM journal_alias WHERE LOWER(REPLACE(alias, '-', '')) = :norm
+            )
+            ORDER BY rank, seq
+            LIMIT 1
+            """,
+            {"norm": _normalise_identifier(identifier)},
+        ).fetchone()
+
+        if row is None:
+            return pd.DataFrame(columns=["type", "id", "quartiles", "areas", "categories"])
+
+        if row["type"] == "journal":
+            journal_id = row["id"]
+            categories = self.fetch_journal_categories(journal_id)
+            areas = sorted(self.fetch_journal_areas(journal_id))
+            return pd.DataFrame(
+                [
+                    {
+                        "type": "journal",
+                        "id": journal_id,
+                        "categories": sorted(categories.keys()),
+                        "areas": areas,
+                    }
+                ]
+            )
+
+        if row["type"] == "category":
+            listing = self._cached_listing("categories", self._build_all_categories)
+            match = listing.loc[listing["id"] == row["id"]].iloc[0]
+            return pd.DataFrame(
+                [
+                    {
+                        "type": "category",
+                        "id": match["id"],
+                        "quartiles": list(match["quartiles"]),
+                        "areas": list(match["areas"]),
+                    }
+                ]
+            )
 
+        listing = self._cached_listing("areas", self._build_all_areas)
+        match = listing.loc[listing["id"] == row["id"]].iloc[0]
         return pd.DataFrame(
-            columns=["type", "id", "quartiles", "areas", "categories"]
+            [
+                {
+                    "type": "area",
+                    "id": match["id"],
+                    "categories": list(match["categories"]),
+                }
+            ]
         )
 
-    def export_all(self) -> Dict[str, dict]:
-        categories: Dict[str, Dict[str, Set[str]]] = defaultdict(lambda: {"quartiles": set(), "areas": set()})
-        areas: Dict[str, Dict[str, Set[str]]] = defaultdict(lambda: {"categories": set()})
-        journal_categories: Dict[str, Dict[str, Set[str]]] = defaultdict(lambda: defaultdict(set))
-        journal_areas: Dict[str, Set[str]] = defaultdict(set)
-        alias_map: Dict[str, str] = {}
-
-        with self._connect() as conn:
-            for row in conn.execute("SELECT category_id, quartile FROM category_quartile"):
-                if row["quartile"]:
-                    categories[row["category_id"]]["quartiles"].add(row["quartile"])
-
-            for row in conn.execute("SELECT category_id, area_id FROM category_area"):
-                categories[row["category_id"]]["areas"].add(row["area_id"])
-                areas[row["area_id"]]["categories"].add(row["category_id"])
-
-            for row in conn.execute("SELECT journal_id, category_id, quartile FROM journal_category"):
-                journal_categories[row["journal_id"]][row["category_id"]].update(
-                    {row["quartile"]} if row["quartile"] else set()
-                )
-
-            for row in conn.execute("SELECT journal_id, area_id FROM journal_area"):
-                journal_areas[row["journal_id"]].add(row["area_id"])
-
-            for row in conn.execute("SELECT alias, journal_id FROM journal_alias"):
-                alias_map[_normalise_identifier(row["alias"])] = row["journal_id"]
+    def export_all(self) -> Dict[str, pd.DataFrame]:
+        """Dump the association tables as tidy frames, aliases already normalised."""
+        conn = self._get_conn()
+        category_quartiles = pd.read_sql_query(
+            "SELECT category_id, quartile FROM category_quartile WHERE quartile <> ''", conn
+        )
+        category_areas = pd.read_sql_query("SELECT category_id, area_id FROM category_area", conn)
+        journal_categories = pd.read_sql_query(
+            "SELECT journal_id, category_id, quartile FROM journal_category", conn
+        )
+        journal_areas = pd.read_sql_query("SELECT journal_id, area_id FROM journal_area", conn)
+        journal_alias = pd.read_sql_query("SELECT alias, journal_id FROM journal_alias", conn)
 
-        export_categories = {
-            cid: {
-                "quartiles": set(data["quartiles"]),
-                "areas": set(data["areas"]),
-            }
-            for cid, data in categories.items()
-        }
-        export_areas = {
-            aid: {
-                "categories": set(data["categories"]),
-            }
-            for aid, data in areas.items()
-        }
-        export_journal_categories = {
-            jid: {cid: set(quartiles) for cid, quartiles in data.items()}
-            for jid, data in journal_categories.items()
-        }
-        export_journal_areas = {
-            jid: set(area_set)
-            for jid, area_set in journal_areas.items()
-        }
+        journal_alias["alias"] = _normalise_series(journal_alias["alias"])
+        # Later rows win within a single database, as with a plain dict update.
+        journal_alias = journal_alias.drop_duplicates(subset="alias", keep="last")
 
         return {
-            "categories": export_categories,
-            "areas": export_areas,
-            "journal_categories": export_journal_categories,
-            "journal_areas": export_journal_areas,
-            "journal_alias": dict(alias_map),
+            "category_quartiles": category_quartiles,
+            "category_areas": category_areas,
+            "journal_categories": journal_categories,
+            "journal_areas": journal_areas,
+            "journal_alias": journal_alias,
         }
 
 
@@ -455,76 +540,108 @@ class _InMemoryJournalStore:
     ]
 
     def __init__(self):
-        self._frame = pd.DataFrame(columns=self.COLUMNS)
+        # Records keyed by id in insertion order; the frame is built lazily from them.
+        self._records: Dict[str, Dict[str, object]] = {}
+        self._frame: Optional[pd.DataFrame] = None
+        # Normalised identifier -> record id, and record id -> row of the materialised frame.
         self._index: Dict[str, str] = {}
+        self._positions: Dict[str, int] = {}
+        # Derived search columns aligned with the materialised frame, built on demand.
+        self._search_columns: Dict[str, pd.Series] = {}
+        self._revision = 0
 
     def add_records(self, records: List[Dict[str, object]]) -> None:
         if not records:
             return
-        new_df = pd.DataFrame.from_records(records)
-        if self._frame.empty:
-            self._frame = new_df
-        else:
-            combined = pd.concat([self._frame, new_df], ignore_index=True)
-            combined = combined.drop_duplicates(subset="id", keep="last")
-            self._frame = combined.reset_index(drop=True)
         for rec in records:
+            # A re-added id moves to the end, as drop_duplicates(keep="last") would do.
+            self._records.pop(rec["id"], None)
+            self._records[rec["id"]] = rec
             for identifier in rec.get("identifiers", ()):
                 normalised = _normalise_identifier(identifier)
                 if normalised:
                     self._index[normalised] = rec["id"]
-                    self._index[_normalise_identifier(identifier.replace("-", ""))] = rec["id"]
+        self._frame = None
+        self._search_columns = {}
+        self._revision += 1
+
+    def revision(self) -> int:
+        return self._revision
+
+    def _materialise(self) -> pd.DataFrame:
+        if self._frame is None:
+            if not self._records:
+                self._frame = pd.DataFrame(columns=self.COLUMNS)
+            else:
+                frame = pd.DataFrame.from_records(list(self._records.values()), columns=self.COLUMNS)
+                for column in ("apc", "doaj_seal"):
+                    frame[column] = frame[column].fillna(False).astype(bool)
+                self._frame = frame
+            self._positions = {record_id: position for position, record_id in enumerate(self._records)}
+        return self._frame
+
+    def _casefolded(self, column: str) -> pd.Series:
+        folded = self._search_columns.get(column)
+        if folded is None:
+            folded = self._materialise()[column].fillna("").str.casefold()
+            self._search_columns[column] = folded
+        return folded
+
+    def _normalised_licenses(self) -> pd.Series:
+        licenses = self._search_columns.get("license")
+        if licenses is None:
+            licenses = _normalise_series(self._materialise()["license"])
+            self._search_columns["license"] = licenses
+        return licenses
 
     def all(self) -> pd.DataFrame:
-        return self._frame.copy()
+        # Under copy-on-write a shallow copy shares the cached data and is duplicated
+        # only if the caller modifies it; otherwise the caller gets a real copy.
+        return self._materialise().copy(deep=not _COPY_ON_WRITE)
 
     def by_identifier(self, identifier: str) -> pd.DataFrame:
         if not identifier:
             return pd.DataFrame(columns=self.COLUMNS)
+        # Every normalised identifier is indexed on insert, so a miss means no match.
         target = self._index.get(_normalise_identifier(identifier))
         if not target:
-            target = self._index.get(_normalise_identifier(identifier.replace("-", "")))
-        if target:
-            frame = self._frame.loc[self._frame["id"] == target]
-            if not frame.empty:
-                return frame.reset_index(drop=True)
-        mask = self._frame["identifiers"].apply(
-            lambda ids: any(_normalise_identifier(identifier) == _normalise_identifier(i) for i in ids)
-        )
-        result = self._frame.loc[mask]
-        return result.reset_index(drop=True) if not result.empty else pd.DataFrame(columns=self.COLUMNS)
+            return pd.DataFrame(columns=self.COLUMNS)
+        frame = self._materialise()
+        return frame.iloc[[self._positions[target]]].reset_index(drop=True)
 
     def by_title(self, title_part: str) -> pd.DataFrame:
-        frame = self.all()
         if not title_part:
-            return frame
-        mask = frame["title"].str.contains(str(title_part), case=False, na=False)
+            return self.all()
+        frame = self._materialise()
+        mask = self._casefolded("title").str.contains(str(title_part).casefold(), regex=False)
         return frame.loc[mask].reset_index(drop=True)
 
     def by_publisher(self, publisher_part: str) -> pd.DataFrame:
-        frame = self.all()
         if not publisher_part:
-            return frame
-        mask = frame["publisher"].str.contains(str(publisher_part), case=False, na=False)
+            return self.all()
+        frame = self._materialise()
+        mask = self._casefolded("publisher").str.contains(str(publisher_part).casefold(), regex=False)
         return frame.loc[mask].reset_index(drop=True)
 
     def by_license(self, licenses: Iterable[str]) -> pd.DataFrame:
-        frame = self.all()
         license_norm = {_normalise_identifier(l) for l in licenses or [] if l}
         if not license_norm:
-            return frame
-        mask = frame["license"].apply(
-            lambda value: _normalise_identifier(value) in license_norm if isinstance(value, str) else False
-        )
+            return self.all()
+        frame = self._materialise()
+        mask = self._normalised_licenses().isin(license_norm)
         return frame.loc[mask].reset_index(drop=True)
 
     def with_apc(self) -> pd.DataFrame:
-        frame = self.all()
-        return frame.loc[frame["apc"] == True].reset_index(drop=True)  # noqa: E712
+        frame = self._materialise()
+        return frame.loc[frame["apc"]].reset_index(drop=True)
 
     def with_doaj_seal(self) -> pd.DataFrame:
-        frame = self.all()
-        return frame.loc[frame["doaj_seal"] == True].reset_index(drop=True)  # noqa: E712
+        frame = self._materialise()
+        return frame.loc[frame["doaj_seal"]].reset_index(drop=True)
+
+
+_PUSH_WORKERS = 8
+_PUSH_POOL_SIZE = 16
 
 
 class SparqlJournalRepository:
@@ -533,52 +650,53 @@ class SparqlJournalRepository:
     def __init__(self, endpoint: str):
         self.endpoint = endpoint
         self._store = _JOURNAL_STORES.setdefault(endpoint, _InMemoryJournalStore())
+        self._session: Optional[requests.Session] = None
 
     # -- loading ---------------------------------------------------------------
 
     def load_csv(self, file_path: str) -> bool:
         if not file_path or not os.path.isfile(file_path):
             return False
-        df = pd.read_csv(file_path, dtype=str).fillna("")
-        records: List[Dict[str, object]] = []
-        for _, row in df.iterrows():
-            title = row.get("Journal title", "").strip()
-            issn_print = row.get("Journal ISSN (print version)", "").strip()
-            issn_e = row.get("Journal EISSN (online version)", "").strip()
-            languages_raw = row.get("Languages in which the journal accepts manuscripts", "")
-            languages = tuple(
-                lang.strip()
-                for lang in str(languages_raw).split(",")
-                if lang and lang.strip()
-            )
-            publisher = row.get("Publisher", "").strip()
-            doaj_seal = str(row.get("DOAJ Seal", "")).strip().lower() == "yes"
-            license_value = row.get("Journal license", "").strip()
-            apc_value = str(row.get("APC", "")).strip().lower() == "yes"
-
-            primary_id = (issn_e or issn_print or title or str(uuid.uuid4())).strip()
-            identifiers = {primary_id}
-            if issn_print:
-                identifiers.add(issn_print)
-            if issn_e:
-                identifiers.add(issn_e)
-            if title:
-                identifiers.add(title)
-
-            records.append(
-                {
-                    "id": primary_id,
-                    "title": title,
-                    "print_issn": issn_print,
-                    "electronic_issn": issn_e,
-                    "languages": tuple(sorted({lang for lang in languages if lang})),
-                    "publisher": publisher,
-                    "doaj_seal": doaj_seal,
-                    "license": license_value,
-                    "apc": apc_value,
-                    "identifiers": tuple(sorted({identifier for identifier in identifiers if identifier})),
-                }
-            )
+        df = pd.read_csv(file_path, dtype=str, engine=_CSV_ENGINE).fillna("")
+
+        def column(name: str) -> pd.Series:
+            if name not in df.columns:
+                return pd.Series("", index=df.index, dtype=object)
+            return df[name].str.strip()
+
+        title = column("Journal title")
+        issn_print = column("Journal ISSN (print version)")
+        issn_e = column("Journal EISSN (online version)")
+
+        primary_id = issn_e.where(issn_e != "", issn_print)
+        primary_id = primary_id.where(primary_id != "", title)
+        missing_id = primary_id == ""
+        if missing_id.any():
+            primary_id = primary_id.copy()
+            primary_id[missing_id] = [uuid.uuid4().hex for _ in range(int(missing_id.sum()))]
+
+        languages = column("Languages in which the journal accepts manuscripts").str.split(",")
+        identifiers = [
+            tuple(sorted({value for value in values if value}))
+            for values in zip(primary_id.tolist(), issn_print.tolist(), issn_e.tolist(), title.tolist())
+        ]
+
+        records: List[Dict[str, object]] = pd.DataFrame(
+            {
+                "id": primary_id,
+                "title": title,
+                "print_issn": issn_print,
+                "electronic_issn": issn_e,
+                "languages": [
+                    tuple(sorted({lang.strip() for lang in langs if lang.strip()})) for langs in languages
+                ],
+                "publisher": column("Publisher"),
+                "doaj_seal": column("DOAJ Seal").str.lower() == "yes",
+                "license": column("Journal license"),
+                "apc": column("APC").str.lower() == "yes",
+                "identifiers": identifiers,
+            }
+        ).to_dict("records")
 
         self._store.add_records(records)
 
@@ -592,52 +710,71 @@ class SparqlJournalRepository:
         return True
 
     def _escape_literal(self, value: str) -> str:
-        escaped = value.replace("\\", "\\\\").replace('"', '\\"')
-        return f'"{escaped}"'
-
-    def _push_records(self, records: Sequence[Dict[str, object]], batch_size: int = 20) -> None:
-        if not records:
-            return
-
+        # Most titles, publishers and identifiers need no escaping at all.
+        if "\\" in value or '"' in value:
+            value = value.replace("\\", "\\\\").replace('"', '\\"')
+        return f'"{value}"'
+
+    def _get_session(self) -> requests.Session:
+        """Return the pooled HTTP session used for updates, creating it on first use."""
+        if self._session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_maxsize=_PUSH_POOL_SIZE)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            self._session = session
+        return self._session
+
+    def _build_update(self, batch: Sequence[Dict[str, object]]) -> str:
         base_uri = "http://example.org/journal/"
-
-        for offset in range(0, len(records), batch_size):
-            batch = records[offset : offset + batch_size]
-            statements = []
-            for rec in batch:
-                subject = f"<{base_uri}{rec['id']}>"
-                statements.append(f"{subject} a <http://example.org/schema/Journal> ;")
-                if rec["title"]:
-                    statements.append(f'    <http://purl.org/dc/terms/title> {self._escape_literal(rec["title"])} ;')
-                if rec["publisher"]:
-                    statements.append(
-                        f'    <http://purl.org/dc/terms/publisher> {self._escape_literal(rec["publisher"])} ;'
-                    )
-                if rec["license"]:
-                    statements.append(
-                        f'    <http://purl.org/dc/terms/license> {self._escape_literal(rec["license"])} ;'
-                    )
+        statements = []
+        for rec in batch:
+            subject = f"<{base_uri}{rec['id']}>"
+            statements.append(f"{subject} a <http://example.org/schema/Journal> ;")
+            if rec["title"]:
+                statements.append(f'    <http://purl.org/dc/terms/title> {self._escape_literal(rec["title"])} ;')
+            if rec["publisher"]:
                 statements.append(
-                    f'    <http://example.org/schema/hasAPC> {"true" if rec["apc"] else "false"} ;'
+                    f'    <http://purl.org/dc/terms/publisher> {self._escape_literal(rec["publisher"])} ;'
                 )
+            if rec["license"]:
                 statements.append(
-                    f'    <http://example.org/schema/hasDOAJSeal> {"true" if rec["doaj_seal"] else "false"} ;'
+                    f'    <http://purl.org/dc/terms/license> {self._escape_literal(rec["license"])} ;'
                 )
-                for identifier in rec["identifiers"]:
-                    statements.append(
-                        f'    <http://purl.org/dc/terms/identifier> {self._escape_literal(identifier)} ;'
-                    )
-                statements[-1] = statements[-1].rstrip(" ;")
-                statements.append(".")
-
-            update = "INSERT DATA { " + " ".join(statements) + " }"
-            requests.post(
+            statements.append(
+                f'    <http://example.org/schema/hasAPC> {"true" if rec["apc"] else "false"} ;'
+            )
+            statements.append(
+                f'    <http://example.org/schema/hasDOAJSeal> {"true" if rec["doaj_seal"] else "false"} ;'
+            )
+            for identifier in rec["identifiers"]:
+                statements.append(
+                    f'    <http://purl.org/dc/terms/identifier> {self._escape_literal(identifier)} ;'
+                )
+            statements[-1] = statements[-1].rstrip(" ;")
+            statements.append(".")
+        return "INSERT DATA { " + " ".join(statements) + " }"
+
+    def _push_records(self, records: Sequence[Dict[str, object]], batch_size: int = 500) -> None:
+        if not records:
+            return
+
+        session = self._get_session()
+
+        def post(offset: int) -> None:
+            update = self._build_update(records[offset : offset + batch_size])
+            session.post(
                 self.endpoint,
                 data=update.encode("utf-8"),
                 headers={"Content-Type": "application/sparql-update"},
-                timeout=10,
+                timeout=30,
             )
 
+        # Batches are independent INSERT DATA updates, so they can be sent concurrently.
+        with ThreadPoolExecutor(max_workers=_PUSH_WORKERS) as executor:
+            for _ in executor.map(post, range(0, len(records), batch_size)):
+                pass
+
     def _is_endpoint_available(self) -> bool:
         parsed = urlparse(self.endpoint)
         if parsed.scheme not in {"http", "https"} or not parsed.hostname:
@@ -651,6 +788,9 @@ class SparqlJournalRepository:
 
     # -- querying --------------------------------------------------------------
 
+    def revision(self) -> Tuple[str, int]:
+        return (self.endpoint, self._store.revision())
+
     def fetch_all(self) -> pd.DataFrame:
         return self._store.all()
 